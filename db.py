@@ -7,6 +7,8 @@ import asyncpg
 
 
 _pool: Optional[asyncpg.Pool] = None
+# Потолок пула; по нему же планировщик ограничивает параллельную доставку
+POOL_MAX_SIZE = 5
 
 
 async def db_pool() -> asyncpg.Pool:
@@ -19,7 +21,7 @@ async def db_pool() -> asyncpg.Pool:
         _pool = await asyncpg.create_pool(
             dsn=os.getenv("DATABASE_URL"),
             min_size=1,
-            max_size=5,
+            max_size=POOL_MAX_SIZE,
             command_timeout=10,                   # сек
             max_inactive_connection_lifetime=300,
             statement_cache_size=0,               # критично для PgBouncer
@@ -137,12 +139,13 @@ async def create_cron(
 
 async def list_by_chat(chat_id: int):
     """
-    Список напоминаний чата для /list — без лишних полей.
+    Список напоминаний чата для /list — только поля, которые выводятся.
+    when_at — время ближайшего срабатывания (remind_at для once, next_at для cron).
     """
     pool = await db_pool()
     rows = await pool.fetch(
         """
-        SELECT id::text, kind, text, remind_at, cron_expr, next_at, paused, category, created_at
+        SELECT id::text, kind, text, cron_expr, COALESCE(next_at, remind_at) AS when_at, paused
         FROM reminders
         WHERE chat_id = $1
         ORDER BY COALESCE(next_at, remind_at) NULLS LAST, created_at
@@ -177,6 +180,29 @@ async def delete_tournament_crons(chat_id: int) -> None:
     )
 
 
+async def replace_tournament_crons(chat_id: int, user_id: int, slots, meta: Any = None) -> None:
+    """
+    Атомарно заменить турнирные слоты чата: DELETE старых + пакетный INSERT новых
+    в одной транзакции (вместо отдельного запроса на каждый слот).
+    slots — итерируемое из (text, cron_expr, next_at_utc).
+    """
+    pool = await db_pool()
+    meta_json = json.dumps(meta, ensure_ascii=False) if meta is not None else None
+    async with pool.acquire() as conn:
+        async with conn.transaction():
+            await conn.execute(
+                "DELETE FROM reminders WHERE chat_id=$1 AND category='tournament'",
+                chat_id,
+            )
+            await conn.executemany(
+                """
+                INSERT INTO reminders (chat_id, user_id, kind, text, cron_expr, next_at, paused, category, meta)
+                VALUES ($1, $2, 'cron', $3, $4, $5, FALSE, 'tournament', $6::jsonb)
+                """,
+                [(chat_id, user_id, text, expr, next_at, meta_json) for text, expr, next_at in slots],
+            )
+
+
 # =========================
 # Due fetching / Delivery
 # =========================
@@ -250,6 +276,31 @@ async def set_tournament(chat_id: int, enabled: bool) -> None:
     )
 
 
+async def subscribe_tournaments(chat_id: int, chat_type: str, title: Optional[str]) -> None:
+    """
+    Регистрация чата + включение турнирной подписки одним запросом (один round-trip вместо двух).
+    """
+    pool = await db_pool()
+    await pool.execute(
+        """
+        WITH c AS (
+            INSERT INTO chats (chat_id, type, title)
+            VALUES ($1, $2, $3)
+            ON CONFLICT (chat_id)
+            DO UPDATE SET
+                type = EXCLUDED.type,
+                title = EXCLUDED.title,
+                updated_at = NOW()
+            RETURNING chat_id
+        )
+        INSERT INTO tournament_subscriptions (chat_id, enabled)
+        SELECT chat_id, TRUE FROM c
+        ON CONFLICT (chat_id) DO UPDATE SET enabled=EXCLUDED.enabled
+        """,
+        chat_id, chat_type, title,
+    )
+
+
 async def get_tournament(chat_id: int) -> bool:
     pool = await db_pool()
     row = await pool.fetchrow(
@@ -313,12 +364,10 @@ async def kv_set_str(key: str, value: str) -> None:
 
 async def kv_get_int(key: str) -> Optional[int]:
     v = await kv_get_str(key)
-    if v is None:
-        return None
-    try:
-        return int(v)
-    except Exception:
+    # значения пишет kv_set_int (str(int)) — проверяем формат без исключения
+    if v is None or not v.removeprefix("-").isdecimal():
         return None
+    return int(v)
 
 
 async def kv_set_int(key: str, value: int) -> None:
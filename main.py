@@ -1,14 +1,22 @@
 import asyncio
+import contextlib
 import logging
 import os
 import random
+import re
+import time
+from collections import OrderedDict
 from datetime import datetime
-from zoneinfo import ZoneInfo
+from functools import lru_cache
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-from aiogram import Bot, Dispatcher, F
+import orjson
+from aiogram import Bot, Dispatcher, F, Router
 from aiogram.client.default import DefaultBotProperties
+from aiogram.client.session.aiohttp import AiohttpSession
 from aiogram.enums import ParseMode, ChatType
-from aiogram.filters import Command, CommandObject
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.filters import Command, CommandObject, StateFilter
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import StatesGroup, State
 from aiogram.types import (
@@ -22,7 +30,10 @@ from aiogram.types import (
     BotCommandScopeAllPrivateChats,
 )
 
-from croniter import croniter
+try:
+    import uvloop
+except ImportError:  # Windows / локальный запуск без uvloop — штатный цикл asyncio
+    uvloop = None
 
 import db
 from scheduler_core import delivery_loop
@@ -30,12 +41,13 @@ from time_parse import (
     parse_once_when,
     parse_repeat_spec,
     to_utc,
+    cron_next,
     format_local_time,
     DEFAULT_TZ,  # Europe/Moscow — базовая TZ для турнирных кронов
 )
 from texts import *
 from texts import TOURNEY_TEMPLATES
-from utils import short_rid, is_owner
+from utils import short_rid, is_owner, log_exception_throttled
 
 logging.basicConfig(level=logging.INFO)
 log = logging.getLogger("remindly")
@@ -43,8 +55,15 @@ log = logging.getLogger("remindly")
 BOT_TOKEN = os.getenv("BOT_TOKEN")
 OWNER_USER_ID = os.getenv("OWNER_USER_ID", "0")
 
+# Ответы Bot API (в т.ч. getUpdates при polling) разбираем через orjson — быстрее stdlib json.
+# Исходящие reply_markup и т.п. тоже сериализуем им; aiogram ждёт str, orjson отдаёт bytes.
+session = AiohttpSession(
+    json_loads=orjson.loads,
+    json_dumps=lambda obj: orjson.dumps(obj).decode(),
+)
+
 # aiogram 3.7+: parse_mode через DefaultBotProperties
-bot = Bot(BOT_TOKEN, default=DefaultBotProperties(parse_mode=ParseMode.HTML))
+bot = Bot(BOT_TOKEN, session=session, default=DefaultBotProperties(parse_mode=ParseMode.HTML))
 dp = Dispatcher()
 
 
@@ -61,20 +80,32 @@ class AddCron(StatesGroup):
     waiting_spec = State()
 
 
+# Шаги мастеров /add и /repeat — в отдельном роутере с фильтром по состоянию:
+# сообщения вне мастера отсекаются одной проверкой, не перебирая все шаги.
+# Подключён после хендлеров dp, поэтому команды приоритетнее ввода в мастере.
+wizard_router = Router(name="wizard")
+wizard_router.message.filter(StateFilter(AddOnce, AddCron))
+dp.include_router(wizard_router)
+
+
 # =========================
 # TZ utils
 # =========================
-async def tz_for_user_only(user_id: int) -> ZoneInfo | None:
-    """Возвращает TZ, сохранённую пользователем, либо None."""
-    tz_name = await db.get_user_timezone(user_id)
+def _zone_or_none(tz_name: str | None) -> ZoneInfo | None:
+    """ZoneInfo по имени из БД; пустое/битое имя → None."""
     if not tz_name:
         return None
     try:
         return ZoneInfo(tz_name)
-    except Exception:
+    except (ZoneInfoNotFoundError, ValueError):
         return None
 
 
+async def tz_for_user_only(user_id: int) -> ZoneInfo | None:
+    """Возвращает TZ, сохранённую пользователем, либо None."""
+    return _zone_or_none(await db.get_user_timezone(user_id))
+
+
 async def effective_tz(user_id: int, chat_id: int) -> ZoneInfo | None:
     """
     Эффективная TZ:
@@ -85,13 +116,7 @@ async def effective_tz(user_id: int, chat_id: int) -> ZoneInfo | None:
     utz = await tz_for_user_only(user_id)
     if utz:
         return utz
-    ctz_name = await db.get_chat_timezone(chat_id)
-    if ctz_name:
-        try:
-            return ZoneInfo(ctz_name)
-        except Exception:
-            return None
-    return None
+    return _zone_or_none(await db.get_chat_timezone(chat_id))
 
 
 def tz_key(tz: ZoneInfo) -> str:
@@ -99,8 +124,42 @@ def tz_key(tz: ZoneInfo) -> str:
     return getattr(tz, "key", str(tz))
 
 
+# Недавно зарегистрированные чаты: chat_id -> (type, title, monotonic-время записи).
+# Повторный upsert с теми же данными в пределах TTL ничего не меняет — пропускаем поход в БД.
+# LRU с потолком: самые давние чаты вытесняются, словарь не растёт всю жизнь процесса.
+_SEEN_CHATS: OrderedDict[int, tuple[str, str | None, float]] = OrderedDict()
+_SEEN_CHATS_TTL_SEC = 600.0
+_SEEN_CHATS_MAX = 10_000
+
+
+def _remember_chat(chat_id: int, chat_type: str, title: str | None, now: float) -> None:
+    _SEEN_CHATS[chat_id] = (chat_type, title, now)
+    _SEEN_CHATS.move_to_end(chat_id)
+    if len(_SEEN_CHATS) > _SEEN_CHATS_MAX:
+        _SEEN_CHATS.popitem(last=False)
+
+
+async def _ensure_chat(m: Message) -> None:
+    chat_id, chat_type, title = m.chat.id, m.chat.type, getattr(m.chat, "title", None)
+    now = time.monotonic()
+    seen = _SEEN_CHATS.get(chat_id)
+    if seen and seen[0] == chat_type and seen[1] == title and now - seen[2] < _SEEN_CHATS_TTL_SEC:
+        _SEEN_CHATS.move_to_end(chat_id)
+        return
+    await db.upsert_chat(chat_id, chat_type, title)
+    _remember_chat(chat_id, chat_type, title, now)
+
+
+def _mark_chat_seen(m: Message) -> None:
+    """Для путей, которые регистрируют чат своим запросом (без db.upsert_chat)."""
+    _remember_chat(m.chat.id, m.chat.type, getattr(m.chat, "title", None), time.monotonic())
+
+
+_GROUP_TYPES = frozenset({ChatType.GROUP, ChatType.SUPERGROUP})
+
+
 def _owner_guard(m: Message) -> bool:
-    if m.chat.type in {ChatType.GROUP, ChatType.SUPERGROUP}:
+    if m.chat.type in _GROUP_TYPES:
         return is_owner(m.from_user.id, OWNER_USER_ID)
     return True
 
@@ -110,7 +169,6 @@ def _owner_guard(m: Message) -> bool:
 # =========================
 @dp.message(Command("start"))
 async def cmd_start(m: Message):
-    await db.upsert_chat(m.chat.id, m.chat.type, getattr(m.chat, "title", None))
     await m.answer(START)
 
 
@@ -145,7 +203,7 @@ async def cmd_set_timezone(m: Message, command: CommandObject):
         return
     try:
         _ = ZoneInfo(arg)  # валидация
-    except Exception:
+    except (ZoneInfoNotFoundError, ValueError):
         await m.answer("Неизвестный часовой пояс. Проверь написание (Region/City).")
         return
 
@@ -155,9 +213,14 @@ async def cmd_set_timezone(m: Message, command: CommandObject):
 
 @dp.message(Command("my_timezone"))
 async def cmd_my_timezone(m: Message):
-    utz = await tz_for_user_only(m.from_user.id)
-    ctz = await db.get_chat_timezone(m.chat.id)
-    eff = await effective_tz(m.from_user.id, m.chat.id)
+    # Оба значения нужны для вывода — читаем по разу и считаем эффективную TZ на месте,
+    # а не повторяем те же SELECT через effective_tz()
+    utz_name, ctz = await asyncio.gather(
+        db.get_user_timezone(m.from_user.id),
+        db.get_chat_timezone(m.chat.id),
+    )
+    utz = _zone_or_none(utz_name)
+    eff = utz or _zone_or_none(ctz)
     await m.answer(
         "🕒 Твои TZ-настройки:\n"
         f"• Личная: <b>{tz_key(utz) if utz else '—'}</b>\n"
@@ -184,10 +247,11 @@ async def cmd_set_chat_timezone(m: Message, command: CommandObject):
 
     try:
         _ = ZoneInfo(arg)
-    except Exception:
+    except (ZoneInfoNotFoundError, ValueError):
         await m.answer("Неизвестный часовой пояс. Проверь написание (Region/City).")
         return
 
+    await _ensure_chat(m)  # UPDATE ниже требует строки в chats
     await db.set_chat_timezone(m.chat.id, arg)
     await m.answer(f"✅ Для этого чата установлен часовой пояс: <b>{arg}</b>")
 
@@ -197,25 +261,30 @@ async def cmd_set_chat_timezone(m: Message, command: CommandObject):
 # =========================
 @dp.message(Command("add"))
 async def cmd_add(m: Message, state: FSMContext):
-    await db.upsert_chat(m.chat.id, m.chat.type, getattr(m.chat, "title", None))
+    await _ensure_chat(m)
     await state.set_state(AddOnce.waiting_text)
     await m.answer(ASK_TEXT_ONCE)
 
 
-# Алиас: /add@BotName
-@dp.message(F.text.regexp(r"^/add(?:@[\w_]+)?\b"))
-async def _alias_add(m: Message, state: FSMContext):
-    return await cmd_add(m, state)
+# Алиасы /add@BotName и /repeat@BotName (фолбэк для групп) — один общий regexp:
+# обычный текст проверяется одним шаблоном вместо двух, команда берётся из группы
+_ALIAS_RE = re.compile(r"^/(add|repeat)(?:@[\w_]+)?\b")
+
 
+@dp.message(F.text.regexp(_ALIAS_RE).as_("alias"))
+async def _alias_add_repeat(m: Message, state: FSMContext, alias: re.Match):
+    handler = cmd_add if alias.group(1) == "add" else cmd_repeat
+    return await handler(m, state)
 
-@dp.message(AddOnce.waiting_text)
+
+@wizard_router.message(AddOnce.waiting_text)
 async def add_once_text(m: Message, state: FSMContext):
     await state.update_data(text=m.text.strip())
     await state.set_state(AddOnce.waiting_when)
     await m.answer(ASK_WHEN_ONCE)
 
 
-@dp.message(AddOnce.waiting_when)
+@wizard_router.message(AddOnce.waiting_when)
 async def add_once_when(m: Message, state: FSMContext):
     data = await state.get_data()
     text = data["text"]
@@ -241,7 +310,7 @@ async def add_once_when(m: Message, state: FSMContext):
     try:
         _ = await db.create_once(m.chat.id, m.from_user.id, text, remind_at_utc)
     except Exception as e:
-        logging.exception("CREATE once failed")
+        log_exception_throttled(log, "CREATE once failed", e)
         await m.answer(f"⚠️ Не удалось сохранить напоминание: {e}")
         return
 
@@ -257,25 +326,19 @@ async def add_once_when(m: Message, state: FSMContext):
 # =========================
 @dp.message(Command("repeat"))
 async def cmd_repeat(m: Message, state: FSMContext):
-    await db.upsert_chat(m.chat.id, m.chat.type, getattr(m.chat, "title", None))
+    await _ensure_chat(m)
     await state.set_state(AddCron.waiting_text)
     await m.answer(ASK_TEXT_CRON)
 
 
-# Фолбэк: /repeat@BotName в группах
-@dp.message(F.text.regexp(r"^/repeat(?:@[\w_]+)?\b"))
-async def cmd_repeat_alias(m: Message, state: FSMContext):
-    return await cmd_repeat(m, state)
-
-
-@dp.message(AddCron.waiting_text)
+@wizard_router.message(AddCron.waiting_text)
 async def add_cron_text(m: Message, state: FSMContext):
     await state.update_data(text=m.text.strip())
     await state.set_state(AddCron.waiting_spec)
     await m.answer(ASK_SPEC_CRON)
 
 
-@dp.message(AddCron.waiting_spec)
+@wizard_router.message(AddCron.waiting_spec)
 async def add_cron_spec(m: Message, state: FSMContext):
     data = await state.get_data()
     text = data["text"]
@@ -302,7 +365,7 @@ async def add_cron_spec(m: Message, state: FSMContext):
     try:
         _ = await db.create_cron(m.chat.id, m.from_user.id, text, cron_expr, next_utc, category=None, meta=meta)
     except Exception as e:
-        logging.exception("CREATE cron failed")
+        log_exception_throttled(log, "CREATE cron failed", e)
         await m.answer(f"⚠️ Не удалось сохранить повторяющееся напоминание: {e}")
         return
 
@@ -316,32 +379,39 @@ async def add_cron_spec(m: Message, state: FSMContext):
 # =========================
 # /list
 # =========================
-def _row_to_line(row, user_tz_name: str) -> str:
-    kind = row["kind"]
-    text = row["text"]
-    paused = row["paused"]
+# Отметка паузы в конце строки, индекс — bool(paused)
+_PAUSE_MARK = ("", "(⏸)")
 
+
+@lru_cache(maxsize=4096)
+def _render_line(kind: str, text: str, when_utc, expr, paused: bool, user_tz_name: str) -> str:
+    """Строка карточки — чистая функция от полей напоминания, кэшируем между /list."""
+    when_str = format_local_time(when_utc, user_tz_name=user_tz_name, with_tz_abbr=False)
+    mark = _PAUSE_MARK[bool(paused)]
     if kind == "once":
-        when_utc = row["remind_at"]
-        when_str = format_local_time(when_utc, user_tz_name=user_tz_name, with_tz_abbr=False)
-        return f"• ⏱ {when_str} — “{text}” {'(⏸)' if paused else ''}"
-    else:
-        nxt_utc = row["next_at"]
-        expr = row["cron_expr"]
-        nxt_str = format_local_time(nxt_utc, user_tz_name=user_tz_name, with_tz_abbr=False)
-        return f"• 🔁 {expr} → {nxt_str} — “{text}” {'(⏸)' if paused else ''}"
-
-
-def _row_buttons(row):
-    rid = row["id"]
+        return f"• ⏱ {when_str} — “{text}” {mark}"
+    return f"• 🔁 {expr} → {when_str} — “{text}” {mark}"
+
+
+# Раскладка кнопок под строкой /list: (текст, префикс callback_data) — от строки зависит только rid
+_ROW_ACTIONS_ACTIVE = (("⏸ Пауза", "pause:"), ("🗑 Удалить", "del:"))
+_ROW_ACTIONS_PAUSED = (("▶️ Возобновить", "resume:"), ("🗑 Удалить", "del:"))
+
+
+@lru_cache(maxsize=1024)
+def _row_markup(rid: str, paused: bool) -> InlineKeyboardMarkup:
+    """Клавиатура строки зависит только от (rid, paused) — повторные /list берут готовую из кэша."""
+    actions = _ROW_ACTIONS_PAUSED if paused else _ROW_ACTIONS_ACTIVE
+    return InlineKeyboardMarkup(inline_keyboard=[[
+        InlineKeyboardButton(text=text, callback_data=prefix + rid) for text, prefix in actions
+    ]])
+
+
+def _render_row(row, user_tz_name: str) -> tuple[str, InlineKeyboardMarkup]:
+    """Текст и клавиатура карточки за один проход по полям строки."""
     paused = row["paused"]
-    btns = []
-    if paused:
-        btns.append(InlineKeyboardButton(text="▶️ Возобновить", callback_data=f"resume:{rid}"))
-    else:
-        btns.append(InlineKeyboardButton(text="⏸ Пауза", callback_data=f"pause:{rid}"))
-    btns.append(InlineKeyboardButton(text="🗑 Удалить", callback_data=f"del:{rid}"))
-    return InlineKeyboardMarkup(inline_keyboard=[btns])
+    line = _render_line(row["kind"], row["text"], row["when_at"], row["cron_expr"], paused, user_tz_name)
+    return line, _row_markup(row["id"], paused)
 
 
 @dp.message(Command("list"))
@@ -356,53 +426,88 @@ async def cmd_list(m: Message):
 
     await m.answer(LIST_HEADER)
     for r in rows:
-        await m.answer(_row_to_line(r, user_tz_name), reply_markup=_row_buttons(r))
+        line, markup = _render_row(r, user_tz_name)
+        await m.answer(line, reply_markup=markup)
 
 
-@dp.callback_query(F.data.startswith(("pause:", "resume:", "del:")))
-async def cb_list_actions(c: CallbackQuery):
-    action, rid = c.data.split(":", 1)
-    if action == "pause":
-        await db.set_paused(rid, True)
-        await c.answer(PAUSED, show_alert=False)
-    elif action == "resume":
-        await db.set_paused(rid, False)
-        await c.answer(RESUMED, show_alert=False)
-    elif action == "del":
-        await db.delete_reminder(rid)
-        await c.answer(DELETED, show_alert=False)
+async def _cb_pause(rid: str) -> str:
+    await db.set_paused(rid, True)
+    return PAUSED
+
+
+async def _cb_resume(rid: str) -> str:
+    await db.set_paused(rid, False)
+    return RESUMED
+
+
+async def _cb_delete(rid: str) -> str:
+    await db.delete_reminder(rid)
+    return DELETED
+
+
+# action из callback_data -> обработчик (возвращает текст всплывашки)
+_LIST_ACTIONS = {"pause": _cb_pause, "resume": _cb_resume, "del": _cb_delete}
+# «action:uuid» — разбор и проверка формы одним вызовом, мусор до БД не доходит
+_LIST_CB_RE = re.compile(r"^(pause|resume|del):([0-9a-f-]{36})$")
+
+
+async def _drop_row_buttons(c: CallbackQuery) -> None:
+    # Кнопки уже сняты (повторное нажатие) или сообщение недоступно — лишний запрос не шлём
+    if getattr(c.message, "reply_markup", None) is None:
+        return
     try:
         await c.message.edit_reply_markup(reply_markup=None)
-    except Exception:
+    except TelegramBadRequest:
+        # сообщение уже без кнопок / слишком старое для редактирования
         pass
 
 
+# Фильтр сам разбирает payload: матч приходит в хендлер, второй проход по строке не нужен
+@dp.callback_query(F.data.regexp(_LIST_CB_RE).as_("cb_match"))
+async def cb_list_actions(c: CallbackQuery, cb_match: re.Match):
+    action, rid = cb_match.groups()
+    notice = await _LIST_ACTIONS[action](rid)
+    # c.answer() возвращает объект метода (awaitable, но не корутину) — asyncio.gather его не примет
+    await c.answer(notice, show_alert=False)
+    await _drop_row_buttons(c)
+
+
+# Регистрируется после cb_list_actions: payload с нашим префиксом, но не прошедший _LIST_CB_RE,
+# в БД не идёт — только пустой ответ, чтобы у кнопки не висел индикатор загрузки
+@dp.callback_query(F.data.startswith(("pause:", "resume:", "del:")))
+async def cb_list_actions_malformed(c: CallbackQuery):
+    await c.answer()
+
+
 # =========================
 # Турнирные подписки (МСК)
 # =========================
+# Время отправки (МСК) — за 5 минут до стартов 15:00,17:00,19:00,21:00,23:00,01:00
+_TOURNEY_SEND_TIMES = ((14, 55), (16, 55), (18, 55), (20, 55), (22, 55), (0, 55))
+_TOURNEY_CRONS = tuple(f"{mm} {hh} * * *" for hh, mm in _TOURNEY_SEND_TIMES)
+
+
 def _tournament_crons_local():
     """
     Напоминания за 5 минут до старта «Быстрого турнира» по МСК.
     Старты: 15:00,17:00,19:00,21:00,23:00,01:00
     Отправляем в 14:55,16:55,18:55,20:55,22:55,00:55 (МСК).
     Возвращаем cron в МЕСТНОМ (DEFAULT_TZ=MSK) времени.
+    Набор фиксированный — строки собраны один раз при импорте.
     """
-    times = [(14, 55), (16, 55), (18, 55), (20, 55), (22, 55), (0, 55)]
-    return [f"{mm} {hh} * * *" for hh, mm in times]
+    return _TOURNEY_CRONS
 
 
 async def _install_tournament_crons_for_chat(chat_id: int, user_id: int):
-    # Идемпотентно чистим старые
-    if hasattr(db, "delete_tournament_crons"):
-        await db.delete_tournament_crons(chat_id)
-
     now_local = datetime.now(tz=DEFAULT_TZ)  # МСК
+    slots = []
     for expr in _tournament_crons_local():
-        next_local = croniter(expr, now_local).get_next(datetime)  # в МСК
-        next_utc = to_utc(next_local, DEFAULT_TZ)                  # храним в UTC
-        text = random.choice(TOURNEY_TEMPLATES)
-        meta = {"tz": "Europe/Moscow"}
-        await db.create_cron(chat_id, user_id, text, expr, next_utc, category="tournament", meta=meta)
+        # тот же расчёт, что у планировщика (ежедневные слоты идут по быстрому пути без croniter)
+        next_utc = to_utc(cron_next(expr, now_local), DEFAULT_TZ)  # храним в UTC
+        slots.append((random.choice(TOURNEY_TEMPLATES), expr, next_utc))
+
+    # Идемпотентно: старые слоты удаляются и новые пишутся одной транзакцией
+    await db.replace_tournament_crons(chat_id, user_id, slots, meta={"tz": "Europe/Moscow"})
 
 
 @dp.message(Command("subscribe_tournaments"))
@@ -410,8 +515,8 @@ async def cmd_sub(m: Message):
     if not _owner_guard(m):
         await m.answer(NOT_ALLOWED)
         return
-    await db.upsert_chat(m.chat.id, m.chat.type, getattr(m.chat, "title", None))
-    await db.set_tournament(m.chat.id, True)
+    await db.subscribe_tournaments(m.chat.id, m.chat.type, getattr(m.chat, "title", None))
+    _mark_chat_seen(m)
     await _install_tournament_crons_for_chat(m.chat.id, m.from_user.id)
     await m.answer(SUB_ON)
 
@@ -444,71 +549,100 @@ async def cmd_tourney_now(m: Message):
 # =========================
 # Команды в меню (вариант A со скоупами)
 # =========================
+# Списки статичны — BotCommand собираем один раз при импорте.
+
+# Приватные чаты: полный набор для пользователей
+_PRIVATE_COMMANDS = [
+    BotCommand(command="start", description="Запустить бота и подсказки"),
+    BotCommand(command="help", description="Показать доступные команды"),
+    BotCommand(command="add", description="Одноразовое напоминание"),
+    BotCommand(command="repeat", description="Повторяющееся напоминание"),
+    BotCommand(command="list", description="Список/пауза/удаление"),
+    BotCommand(command="set_timezone", description="Установить свой часовой пояс"),
+    BotCommand(command="my_timezone", description="Показать свой часовой пояс"),
+    BotCommand(command="ping", description="Проверка связи"),
+    # Скрытые: не добавляем сюда (например, tourney_now)
+]
+
+# Группы: команды, полезные в группах
+_GROUP_COMMANDS = [
+    BotCommand(command="add", description="Одноразовое напоминание"),
+    BotCommand(command="repeat", description="Повторяющееся напоминание"),
+    BotCommand(command="list", description="Список напоминаний, пауза/возобновление/удаление"),
+    BotCommand(command="set_timezone", description="Установить свой часовой пояс"),
+    BotCommand(command="my_timezone", description="Показать свой часовой пояс"),
+    BotCommand(command="subscribe_tournaments", description="Включить турнирные напоминания"),
+    BotCommand(command="unsubscribe_tournaments", description="Отключить турнирные напоминания"),
+    # tourney_now — скрыта из меню
+]
+
+# На всякий случай дефолтный скоуп (если Telegram-клиент проигнорирует частные):
+_DEFAULT_COMMANDS = [
+    BotCommand(command="help", description="Список доступных команд"),
+    BotCommand(command="add", description="Одноразовое напоминание"),
+    BotCommand(command="repeat", description="Повторяющееся напоминание"),
+    BotCommand(command="list", description="Список/пауза/удаление"),
+    BotCommand(command="set_timezone", description="Установить свой часовой пояс"),
+    BotCommand(command="my_timezone", description="Показать свой часовой пояс"),
+    BotCommand(command="set_chat_timezone", description="Часовой пояс чата"),
+    BotCommand(command="subscribe_tournaments", description="Включить турнирные"),
+    BotCommand(command="unsubscribe_tournaments", description="Выключить турнирные"),
+    BotCommand(command="ping", description="Проверка связи"),
+]
+
+
 async def set_commands(bot: Bot):
-    # Приватные чаты: полный набор для пользователей
-    private_cmds = [
-        BotCommand(command="start", description="Запустить бота и подсказки"),
-        BotCommand(command="help", description="Показать доступные команды"),
-        BotCommand(command="add", description="Одноразовое напоминание"),
-        BotCommand(command="repeat", description="Повторяющееся напоминание"),
-        BotCommand(command="list", description="Список/пауза/удаление"),
-        BotCommand(command="set_timezone", description="Установить свой часовой пояс"),
-        BotCommand(command="my_timezone", description="Показать свой часовой пояс"),
-        BotCommand(command="ping", description="Проверка связи"),
-        # Скрытые: не добавляем сюда (например, tourney_now)
-    ]
-    await bot.set_my_commands(private_cmds, scope=BotCommandScopeAllPrivateChats())
-
-    # Группы: команды, полезные в группах
-    group_cmds = [
-        BotCommand(command="add", description="Одноразовое напоминание"),
-        BotCommand(command="repeat", description="Повторяющееся напоминание"),
-        BotCommand(command="list", description="Список напоминаний, пауза/возобновление/удаление"),
-        BotCommand(command="set_timezone", description="Установить свой часовой пояс"),
-        BotCommand(command="my_timezone", description="Показать свой часовой пояс"),
-        BotCommand(command="subscribe_tournaments", description="Включить турнирные напоминания"),
-        BotCommand(command="unsubscribe_tournaments", description="Отключить турнирные напоминания"),
-        # tourney_now — скрыта из меню
-    ]
-    await bot.set_my_commands(group_cmds, scope=BotCommandScopeAllGroupChats())
-
-    # На всякий случай дефолтный скоуп (если Telegram-клиент проигнорирует частные):
-    default_cmds = [
-        BotCommand(command="help", description="Список доступных команд"),
-        BotCommand(command="add", description="Одноразовое напоминание"),
-        BotCommand(command="repeat", description="Повторяющееся напоминание"),
-        BotCommand(command="list", description="Список/пауза/удаление"),
-        BotCommand(command="set_timezone", description="Установить свой часовой пояс"),
-        BotCommand(command="my_timezone", description="Показать свой часовой пояс"),
-        BotCommand(command="set_chat_timezone", description="Часовой пояс чата"),
-        BotCommand(command="subscribe_tournaments", description="Включить турнирные"),
-        BotCommand(command="unsubscribe_tournaments", description="Выключить турнирные"),
-        BotCommand(command="ping", description="Проверка связи"),
-    ]
-    await bot.set_my_commands(default_cmds, scope=BotCommandScopeDefault())
+    # Скоупы не пересекаются — отправляем все три запроса параллельно
+    await asyncio.gather(
+        bot.set_my_commands(_PRIVATE_COMMANDS, scope=BotCommandScopeAllPrivateChats()),
+        bot.set_my_commands(_GROUP_COMMANDS, scope=BotCommandScopeAllGroupChats()),
+        bot.set_my_commands(_DEFAULT_COMMANDS, scope=BotCommandScopeDefault()),
+    )
 
 
 # =========================
 # Запуск
 # =========================
-async def on_startup():
-    # Переключаемся на polling (снимаем вебхук)
-    await bot.delete_webhook(drop_pending_updates=False)
+_delivery_task: asyncio.Task | None = None
 
-    # Устанавливаем команды (скоупы: приватные, группы, дефолт)
-    await set_commands(bot)
 
-    me = await bot.get_me()
+async def on_startup():
+    # Переключаемся на polling (снимаем вебхук) и устанавливаем команды
+    # (скоупы: приватные, группы, дефолт) — запросы независимы, шлём параллельно
+    # Пул БД поднимаем здесь же: первый апдейт не ждёт коннекта к Postgres.
+    # Если БД недоступна — бот не стартует (ошибка из gather), а не падает на первом апдейте.
+    # bot.me() кэширует профиль — его переиспользуют start_polling и Command (проверка @mention)
+    me, *_ = await asyncio.gather(
+        bot.me(),
+        bot.delete_webhook(drop_pending_updates=False),
+        set_commands(bot),
+        db.db_pool(),
+    )
     logging.info("Bot is up: @%s (id=%s) DEFAULT_TZ=%s", me.username, me.id, DEFAULT_TZ.key)
 
     # Фоновый планировщик
-    asyncio.create_task(delivery_loop(bot))
+    global _delivery_task
+    _delivery_task = asyncio.create_task(delivery_loop(bot))
+
+
+async def on_shutdown():
+    # Сначала останавливаем планировщик: иначе следующий тик через db.db_pool()
+    # молча пересоздаст только что закрытый пул
+    if _delivery_task is not None:
+        _delivery_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _delivery_task
+    await db.close_db_pool()
 
 
 def main():
     if not os.getenv("BOT_TOKEN") or not os.getenv("DATABASE_URL"):
         raise RuntimeError("BOT_TOKEN / DATABASE_URL не заданы")
     dp.startup.register(on_startup)
+    dp.shutdown.register(on_shutdown)
+    if uvloop is not None:
+        # libuv-цикл: дешевле планирование задач и работа с сокетами (polling, Bot API, asyncpg)
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     dp.run_polling(bot)
 
 
@@ -2,20 +2,24 @@
 import asyncio
 import logging
 import os
+import time
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
-from croniter import croniter
 from aiogram import Bot
+from aiogram.exceptions import TelegramRetryAfter
 
 import db
 from time_parse import (
     DEFAULT_TZ,   # базовый TZ — fallback
+    UTC_TZ,
+    cron_next,
     to_local,
     to_utc,
     humanize_repeat_suffix,
 )
 from texts import REMINDER_PREFIX, REMINDER_CRON_SUFFIX, tournament_phrase_by_index
+from utils import log_exception_throttled
 
 log = logging.getLogger(__name__)
 
@@ -29,25 +33,90 @@ def _env_int(name: str, default: int) -> int:
 
 SCHEDULER_INTERVAL_SEC = _env_int("SCHEDULER_INTERVAL_SEC", 10)
 BATCH_LIMIT = _env_int("BATCH_LIMIT", 50)
+# Сколько напоминаний обрабатывается одновременно. Каждое ходит в БД (kv для турниров,
+# сдвиг cron), поэтому не больше пула asyncpg — одно соединение оставляем хендлерам.
+SEND_CONCURRENCY = _env_int("SEND_CONCURRENCY", max(1, db.POOL_MAX_SIZE - 1))
+# Темп отправки на весь бот: у Bot API общий лимит ~30 сообщений/с, берём с запасом.
+# Семафор выше ограничивает только число одновременных запросов, но не их частоту.
+SEND_RATE_PER_SEC = _env_int("SEND_RATE_PER_SEC", 25)
+
+
+class _SendPacer:
+    """Равномерный темп отправок: каждое сообщение бронирует свой слот времени."""
+
+    def __init__(self, rate_per_sec: int):
+        self._interval = 1.0 / max(1, rate_per_sec)
+        self._next_at = 0.0
+
+    async def wait(self) -> None:
+        now = time.monotonic()
+        at = max(now, self._next_at)
+        self._next_at = at + self._interval
+        if at > now:
+            await asyncio.sleep(at - now)
+
+    def pause(self, seconds: float) -> None:
+        """Flood control от Telegram касается всего бота — сдвигаем темп для всех."""
+        self._next_at = max(self._next_at, time.monotonic() + seconds)
+
+
+_pacer = _SendPacer(SEND_RATE_PER_SEC)
 
 
 async def delivery_loop(bot: Bot):
     """Фоновая задача: каждые N секунд доставляет due-напоминания батчами."""
     await asyncio.sleep(2.0)
     log.info(
-        "Scheduler started with interval=%s sec, batch=%s",
-        SCHEDULER_INTERVAL_SEC, BATCH_LIMIT,
+        "Scheduler started with interval=%s sec, batch=%s, concurrency=%s, rate=%s/s",
+        SCHEDULER_INTERVAL_SEC, BATCH_LIMIT, SEND_CONCURRENCY, SEND_RATE_PER_SEC,
     )
+    send_slots = asyncio.Semaphore(SEND_CONCURRENCY)
     while True:
         try:
             rows = await db.fetch_due(BATCH_LIMIT)
+            # Очередь на чат: внутри чата — по порядку срабатывания, разные чаты — параллельно
+            by_chat: dict[int, list] = {}
             for r in rows:
-                await _process_due(bot, r)
+                by_chat.setdefault(r["chat_id"], []).append(r)
+            results = await asyncio.gather(
+                *(_process_chat(bot, chat_rows, send_slots) for chat_rows in by_chat.values()),
+                return_exceptions=True,
+            )
+            for chat_id, res in zip(by_chat, results):
+                if isinstance(res, Exception):
+                    log.error("Scheduler chat error chat=%s: %s", chat_id, res, exc_info=res)
         except Exception as e:
-            log.exception("Scheduler tick error: %s", e)
+            log_exception_throttled(log, "Scheduler tick error", e)
         await asyncio.sleep(SCHEDULER_INTERVAL_SEC)
 
 
+async def _process_chat(bot: Bot, rows: list, send_slots: asyncio.Semaphore):
+    for r in rows:
+        async with send_slots:
+            await _process_due(bot, r, send_slots)
+
+
+async def _send(bot: Bot, chat_id: int, text: str, send_slots: asyncio.Semaphore):
+    """Вызывается под send_slots; на время ожидания flood control слот отпускаем."""
+    # parse_mode задан через DefaultBotProperties при создании Bot,
+    # оставляем резервный параметр на случай переопределения
+    parse_mode = os.getenv("PARSE_MODE", "HTML")
+    await _pacer.wait()
+    try:
+        await bot.send_message(chat_id, text, parse_mode=parse_mode)
+    except TelegramRetryAfter as e:
+        # flood control: ждём, сколько сказал Telegram, и пробуем ещё раз — иначе напоминание
+        # потеряется (cron всё равно сдвинется дальше)
+        log.warning("Flood control chat=%s, retry in %s sec", chat_id, e.retry_after)
+        _pacer.pause(e.retry_after)
+        send_slots.release()
+        try:
+            await _pacer.wait()
+        finally:
+            await send_slots.acquire()
+        await bot.send_message(chat_id, text, parse_mode=parse_mode)
+
+
 def _tz_from_meta(meta) -> ZoneInfo:
     """
     Достаём таймзону из meta (jsonb) напоминания.
@@ -61,7 +130,7 @@ def _tz_from_meta(meta) -> ZoneInfo:
         return DEFAULT_TZ
 
 
-async def _process_due(bot: Bot, r: dict):
+async def _process_due(bot: Bot, r: dict, send_slots: asyncio.Semaphore):
     rid = r["id"]
     chat_id = r["chat_id"]
     kind = r["kind"]                # 'once' | 'cron'
@@ -95,38 +164,23 @@ async def _process_due(bot: Bot, r: dict):
     cron_tz = _tz_from_meta(meta)
 
     try:
-        await bot.send_message(
-            chat_id,
-            message_text + (suffix if kind == "cron" else ""),
-            # parse_mode задан через DefaultBotProperties при создании Bot,
-            # оставляем резервный параметр на случай переопределения:
-            parse_mode=os.getenv("PARSE_MODE", "HTML"),
-        )
+        await _send(bot, chat_id, message_text + (suffix if kind == "cron" else ""), send_slots)
 
         if kind == "once":
             # одноразовое — помечаем доставленным
             await db.mark_once_delivered_success(rid)
-        else:
-            # cron — сдвигаем next_at
-            if not cron_expr:
-                log.warning("Cron reminder without cron_expr, rid=%s", rid)
-            else:
-                base = next_at or datetime.now(tz=ZoneInfo("UTC"))
-                # base(UTC) -> локаль (cron_tz) -> расчёт следующего -> снова UTC
-                local_base = to_local(base, cron_tz)
-                nxt_local = croniter(cron_expr, local_base).get_next(datetime)
-                nxt_utc = to_utc(nxt_local, cron_tz)
-                await db.shift_cron_next(rid, nxt_utc)
-
     except Exception as e:
-        # Чтобы не зациклиться, пробуем сдвинуть cron даже при ошибке отправки
-        if kind == "cron" and cron_expr:
-            try:
-                base = next_at or datetime.now(tz=ZoneInfo("UTC"))
-                local_base = to_local(base, cron_tz)
-                nxt_local = croniter(cron_expr, local_base).get_next(datetime)
-                nxt_utc = to_utc(nxt_local, cron_tz)
-                await db.shift_cron_next(rid, nxt_utc)
-            except Exception:
-                pass
         log.warning("Delivery error rid=%s chat=%s: %s", rid, chat_id, e)
+
+    # cron — сдвигаем next_at в любом случае (и при ошибке отправки), чтобы не зациклиться
+    if kind == "cron":
+        if not cron_expr:
+            log.warning("Cron reminder without cron_expr, rid=%s", rid)
+            return
+        try:
+            base = next_at or datetime.now(tz=UTC_TZ)
+            # base(UTC) -> локаль (cron_tz) -> расчёт следующего -> снова UTC
+            nxt_local = cron_next(cron_expr, to_local(base, cron_tz))
+            await db.shift_cron_next(rid, to_utc(nxt_local, cron_tz))
+        except Exception as e:
+            log.warning("Cron shift error rid=%s chat=%s: %s", rid, chat_id, e)
@@ -0,0 +1,8 @@
+import os
+import sys
+
+# Модули бота лежат в корне репозитория, без пакета
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# main.py создаёт Bot при импорте — нужен токен правильного формата
+os.environ.setdefault("BOT_TOKEN", "42:TEST")
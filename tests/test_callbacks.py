@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiogram")
+pytest.importorskip("asyncpg")
+pytest.importorskip("croniter")
+pytest.importorskip("orjson")
+
+from aiogram import Bot
+from aiogram.client.session.base import BaseSession
+from aiogram.methods import AnswerCallbackQuery, EditMessageReplyMarkup
+from aiogram.types import Update
+
+import db
+import main
+
+RID = "0b6f3a52-6d1c-4d8e-9a47-2f1e5c3b7a10"
+
+
+class FakeSession(BaseSession):
+    """Вместо HTTP складывает вызванные методы Bot API в список."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    async def make_request(self, bot, method, timeout=None):
+        self.calls.append(method)
+        return True
+
+    async def stream_content(self, url, headers=None, timeout=30, chunk_size=65536, raise_for_status=True):
+        yield b""
+
+    async def close(self):
+        pass
+
+
+def _callback_update(data: str) -> Update:
+    user = {"id": 1, "is_bot": False, "first_name": "U"}
+    return Update.model_validate({
+        "update_id": 1,
+        "callback_query": {
+            "id": "cb1",
+            "from": user,
+            "chat_instance": "ci",
+            "data": data,
+            "message": {
+                "message_id": 10,
+                "date": 0,
+                "chat": {"id": 100, "type": "private"},
+                "from": {"id": 42, "is_bot": True, "first_name": "Bot"},
+                "text": "• ⏱ 09:00 — “x”",
+                "reply_markup": main._row_markup(RID, False).model_dump(),
+            },
+        },
+    })
+
+
+def _feed(data: str) -> list:
+    session = FakeSession()
+    bot = Bot("42:TEST", session=session)
+    asyncio.run(main.dp.feed_update(bot, _callback_update(data)))
+    return session.calls
+
+
+def test_pause_answers_and_drops_keyboard(monkeypatch):
+    paused = []
+
+    async def fake_set_paused(rid, value):
+        paused.append((rid, value))
+
+    monkeypatch.setattr(db, "set_paused", fake_set_paused)
+    calls = _feed(f"pause:{RID}")
+
+    assert paused == [(RID, True)]
+    assert [type(c) for c in calls] == [AnswerCallbackQuery, EditMessageReplyMarkup]
+    assert calls[0].text == main.PAUSED
+
+
+def test_malformed_payload_is_answered_without_db(monkeypatch):
+    async def fail(*args):
+        raise AssertionError("DB не должна вызываться")
+
+    monkeypatch.setattr(db, "delete_reminder", fail)
+    calls = _feed("del:not-a-uuid")
+
+    assert [type(c) for c in calls] == [AnswerCallbackQuery]
@@ -0,0 +1,26 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("asyncpg")
+
+import db
+
+
+@pytest.mark.parametrize("stored, expected", [
+    ("5", 5),
+    ("-5", -5),
+    ("0", 0),
+    ("--5", None),
+    ("+5", None),
+    ("", None),
+    ("-", None),
+    ("abc", None),
+    (None, None),
+])
+def test_kv_get_int(monkeypatch, stored, expected):
+    async def fake_kv_get_str(key):
+        return stored
+
+    monkeypatch.setattr(db, "kv_get_str", fake_kv_get_str)
+    assert asyncio.run(db.kv_get_int("k")) == expected
@@ -0,0 +1,157 @@
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+croniter = pytest.importorskip("croniter").croniter
+
+from time_parse import UTC_TZ, cron_next, humanize_repeat_suffix, parse_once_when, parse_repeat_spec
+
+MSK = ZoneInfo("Europe/Moscow")
+NOW = datetime(2026, 10, 16, 9, 30, tzinfo=MSK)
+
+# Ожидания сняты с исходной реализации парсеров (до быстрых путей и объединения шаблонов)
+ONCE_CASES = [
+    ("+15", (2026, 10, 16, 9, 45, 0), "через 15 минут"),
+    ("+ 90", (2026, 10, 16, 11, 0, 0), "через 90 минут"),
+    ("+1ч", (2026, 10, 16, 10, 30, 0), "через 60 минут"),
+    ("+ 1 ч 30 мин", (2026, 10, 16, 11, 0, 0), "через 90 минут"),
+    ("+1h 20m", (2026, 10, 16, 10, 50, 0), "через 80 минут"),
+    ("+5 мин", (2026, 10, 16, 9, 35, 0), "через 5 минут"),
+    ("через полчаса", (2026, 10, 16, 10, 0, 0), "через 30 минут"),
+    ("через минуту", (2026, 10, 16, 9, 31, 0), "через 1 минуту"),
+    ("через пару минут", (2026, 10, 16, 9, 32, 0), "через 2 минуты"),
+    ("через тройку часов", (2026, 10, 16, 12, 30, 0), "через 180 минут"),
+    ("через две минуты", (2026, 10, 16, 9, 32, 0), "через 2 минуты"),
+    ("через 0,6 мин", (2026, 10, 16, 9, 30, 36), "через 1 минуту"),
+    ("через 1,5 часа", (2026, 10, 16, 11, 0, 0), "через 90 минут"),
+    ("через 45 минут", (2026, 10, 16, 10, 15, 0), "через 45 минут"),
+    ("через 3 дня", (2026, 10, 19, 9, 30, 0), "через 4320 минут"),
+    ("через 1 ч 30 мин", (2026, 10, 16, 11, 0, 0), "через 90 минут"),
+    ("через 1 час и 30 минут", (2026, 10, 16, 11, 0, 0), "через 90 минут"),
+    ("спустя 3 дня", (2026, 10, 19, 9, 30, 0), "через 4320 минут"),
+    ("через день", (2026, 10, 17, 9, 30, 0), "через 1440 минут"),
+    ("через неделю ровно", (2026, 10, 23, 9, 30, 0), "через 10080 минут"),
+    ("через месяц", (2026, 11, 15, 9, 30, 0), "через 43200 минут"),
+    ("сегодня 21:30", (2026, 10, 16, 21, 30, 0), "сегодня в 21:30"),
+    ("сегодня 08:00", (2026, 10, 17, 8, 0, 0), "завтра в 08:00"),
+    ("завтра 09:00", (2026, 10, 17, 9, 0, 0), "завтра в 09:00"),
+    ("завтра 7:10 pm", (2026, 10, 17, 19, 10, 0), "завтра в 19:10"),
+    ("7:10 pm", (2026, 10, 16, 19, 10, 0), "сегодня в 19:10"),
+    ("в 23:59", (2026, 10, 16, 23, 59, 0), "сегодня в 23:59"),
+    ("в 08:00", (2026, 10, 17, 8, 0, 0), "завтра в 08:00"),
+    ("в 9 утра", (2026, 10, 17, 9, 0, 0), "завтра в 09:00"),
+    ("в полночь", (2026, 10, 17, 0, 0, 0), "завтра в 00:00"),
+    ("в полдень", (2026, 10, 16, 12, 0, 0), "сегодня в 12:00"),
+    ("19:10", (2026, 10, 16, 19, 10, 0), "сегодня в 19:10"),
+    ("08:05", (2026, 10, 17, 8, 5, 0), "завтра в 08:05"),
+    ("  14:30 ", (2026, 10, 16, 14, 30, 0), "сегодня в 14:30"),
+    ("  Через   30   Минут ", (2026, 10, 16, 10, 0, 0), "через 30 минут"),
+]
+
+REPEAT_CASES = [
+    ("каждую минуту", "*/1 * * * *", "через 1 минуту"),
+    ("каждые 5 минут", "*/5 * * * *", "через 5 минут"),
+    ("каждые три минуты", "*/3 * * * *", "через 3 минуты"),
+    ("каждый час", "0 */1 * * *", "каждый час"),
+    ("каждые 3 часа", "0 */3 * * *", "каждые 3 часа"),
+    ("по будням 10:00", "0 10 * * 1-5", "по будням"),
+    ("ежедневно 09:30", "30 9 * * *", "ежедневно"),
+    ("ежедневно 7 pm", "0 19 * * *", "ежедневно"),
+    ("12:00", "0 12 * * *", "ежедневно"),
+    ("7:10 pm", "10 19 * * *", "ежедневно"),
+    ("каждое первое число", "0 9 1 * *", "ежемесячно"),
+    ("ежемесячно 10 числа в 08:00", "0 8 10 * *", "ежемесячно"),
+    ("25 числа каждого месяца 18:30", "30 18 25 * *", "ежемесячно"),
+    ("cron: */15 * * * *", "*/15 * * * *", "по cron"),
+    ("  Ежедневно   09:30 ", "30 9 * * *", "ежедневно"),
+]
+
+# Выражения, которые cron_next считает без croniter, и пара «обычных» для сравнения
+CRON_EXPRS = [
+    "* * * * *", "*/1 * * * *", "*/5 * * * *", "*/7 * * * *",
+    "30 2 * * *", "30 1 * * *", "0 9 * * *", "55 14 * * *",
+    "0 10 * * 1-5", "0 */3 * * *",
+]
+
+# Зона и дни перевода часов в 2026 году: (на летнее, на зимнее)
+DST_ZONES = [
+    ("America/New_York", (2026, 3, 8), (2026, 11, 1)),
+    ("Europe/Berlin", (2026, 3, 29), (2026, 10, 25)),
+]
+
+
+def _bases_around(tz: ZoneInfo, day: tuple[int, int, int]):
+    """Моменты за двое суток до и после перевода; шаг 17 минут даёт и «круглые», и нет."""
+    start = datetime(*day, tzinfo=tz).astimezone(UTC_TZ) - timedelta(days=2)
+    for i in range(4 * 24 * 60 // 17):
+        yield (start + timedelta(minutes=17 * i)).astimezone(tz)
+
+
+def _expected(expr: str, base: datetime) -> datetime:
+    return croniter(expr, base).get_next(datetime)
+
+
+@pytest.mark.parametrize("tz_name, spring, autumn", DST_ZONES)
+@pytest.mark.parametrize("expr", CRON_EXPRS)
+def test_cron_next_matches_croniter_across_dst(tz_name, spring, autumn, expr):
+    tz = ZoneInfo(tz_name)
+    for day in (spring, autumn):
+        for base in _bases_around(tz, day):
+            assert cron_next(expr, base) == _expected(expr, base), (expr, base)
+
+
+@pytest.mark.parametrize("tz_name", ["UTC", "Europe/Moscow", "America/New_York"])
+@pytest.mark.parametrize("expr", CRON_EXPRS)
+def test_cron_next_matches_croniter_on_plain_days(tz_name, expr):
+    tz = ZoneInfo(tz_name)
+    for base in _bases_around(tz, (2026, 6, 15)):
+        assert cron_next(expr, base) == _expected(expr, base), (expr, base)
+
+
+@pytest.mark.parametrize("tz_name, day", [("America/New_York", (2026, 3, 7)), ("Europe/Berlin", (2026, 3, 28))])
+def test_daily_slot_falling_into_spring_gap(tz_name, day):
+    # Планировщик передаёт прошлый next_at: 02:30 накануне перевода -> 02:30 следующего дня не существует
+    base = datetime(*day, 2, 30, tzinfo=ZoneInfo(tz_name))
+    assert cron_next("30 2 * * *", base) == _expected("30 2 * * *", base)
+
+
+def test_cron_next_naive_base():
+    base = datetime(2026, 6, 15, 10, 7, 30)
+    for expr in CRON_EXPRS:
+        assert cron_next(expr, base) == _expected(expr, base), expr
+
+
+@pytest.mark.parametrize("text, when, human", ONCE_CASES)
+def test_parse_once_when_matches_previous_implementation(text, when, human):
+    assert parse_once_when(text, NOW, MSK) == (datetime(*when, tzinfo=MSK), human)
+
+
+@pytest.mark.parametrize("text", ["25:00", "abc", "", "+", "в 24:00"])
+def test_parse_once_when_rejects(text):
+    with pytest.raises(ValueError):
+        parse_once_when(text, NOW, MSK)
+
+
+@pytest.mark.parametrize("text, expr, human", REPEAT_CASES)
+def test_parse_repeat_spec_matches_previous_implementation(text, expr, human):
+    # Дважды: второй вызов берёт разбор из кэша, next_local всё равно считается от now
+    for now in (NOW, NOW + timedelta(hours=13, minutes=7)):
+        assert parse_repeat_spec(text, now) == (expr, human, _expected(expr, now))
+
+
+@pytest.mark.parametrize("text", ["хз", "каждые 0 минут", "cron: bad", "ежедневно 25:00"])
+def test_parse_repeat_spec_rejects(text):
+    with pytest.raises(Exception):
+        parse_repeat_spec(text, NOW)
+
+
+@pytest.mark.parametrize("expr, human", [
+    ("*/5 * * * *", "Повтор через 5 минут"),
+    ("30 9 * * *", "Повтор ежедневно"),
+    ("0 10 * * 1-5", "Повтор по будням"),
+    ("0 9 1 * *", "Повтор ежемесячно"),
+    ("0 */3 * * *", "Повтор по расписанию"),
+])
+def test_humanize_repeat_suffix(expr, human):
+    assert humanize_repeat_suffix(expr) == human
@@ -1,7 +1,8 @@
 import os
 import re
 from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
+from functools import lru_cache
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 from croniter import croniter
 
 # ---------------------------------------------
@@ -11,13 +12,14 @@ from croniter import croniter
 DEFAULT_TZ_NAME = os.getenv("DEFAULT_TZ", "Europe/Moscow")
 DEFAULT_TZ = ZoneInfo(DEFAULT_TZ_NAME)
 MSK_TZ = ZoneInfo("Europe/Moscow")  # фикс для турниров и совместимости
+UTC_TZ = ZoneInfo("UTC")
 
 
 def _safe_zone(tz_name: str | None) -> ZoneInfo:
     try:
         if tz_name:
             return ZoneInfo(tz_name)
-    except Exception:
+    except (ZoneInfoNotFoundError, ValueError):
         pass
     return DEFAULT_TZ
 
@@ -26,13 +28,22 @@ def _is_american_tz(tz_name: str | None) -> bool:
     return bool(tz_name) and tz_name.startswith("America/")
 
 
+def _probe_12h_format() -> str:
+    # «%-I» (час без нуля) есть в glibc/BSD; на Windows вместо него «%#I»
+    try:
+        datetime.now().strftime("%-I")
+        return "%-I:%M %p"
+    except Exception:
+        return "%#I:%M %p"
+
+
+# Платформа не меняется во время работы — проверяем один раз при импорте
+_HOUR_FORMAT_12H = _probe_12h_format()
+
+
 def _hour_format_for(tz_name: str | None) -> str:
     if _is_american_tz(tz_name):
-        try:
-            datetime.now().strftime("%-I")
-            return "%-I:%M %p"
-        except Exception:
-            return "%#I:%M %p"
+        return _HOUR_FORMAT_12H
     return "%H:%M"
 
 
@@ -47,7 +58,7 @@ def format_local_time(dt_utc: datetime, user_tz_name: str | None = None, with_tz
 
 
 def msk_to_local_time_str(dt_msk: datetime, user_tz_name: str | None = None, with_tz_abbr: bool = False) -> str:
-    dt_utc = dt_msk.astimezone(ZoneInfo("UTC"))
+    dt_utc = dt_msk.astimezone(UTC_TZ)
     return format_local_time(dt_utc, user_tz_name=user_tz_name, with_tz_abbr=with_tz_abbr)
 
 
@@ -86,22 +97,29 @@ def pluralize_minute_acc(n: int) -> str:
 # Человечный суффикс для повторов
 # ---------------------------------------------
 
+# Формы cron, которые сами генерируем в parse_repeat_spec
+_EVERY_N_MIN_CRON_RE = re.compile(r"^\*/(\d+)\s+\*\s+\*\s+\*\s+\*$")
+_DAILY_CRON_RE = re.compile(r"^(\d{1,2})\s+(\d{1,2})\s+\*\s+\*\s+\*$")
+_WEEKDAYS_CRON_RE = re.compile(r"^\d{1,2}\s+\d{1,2}\s+\*\s+\*\s+1-5$")
+_MONTHLY_CRON_RE = re.compile(r"^\d{1,2}\s+\d{1,2}\s+\d{1,2}\s+\*\s+\*$")
+
+
 def humanize_repeat_suffix(cron_expr: str) -> str:
-    m = re.match(r"^\*/(\d+)\s+\*\s+\*\s+\*\s+\*$", cron_expr)
+    m = _EVERY_N_MIN_CRON_RE.match(cron_expr)
     if m:
         n = int(m.group(1))
         return f"Повтор через {n} {pluralize_minute_acc(n)}"
 
     # Ежедневно (H M * * *)
-    if re.match(r"^\d{1,2}\s+\d{1,2}\s+\*\s+\*\s+\*$", cron_expr):
+    if _DAILY_CRON_RE.match(cron_expr):
         return "Повтор ежедневно"
 
     # По будням (H M * * 1-5)
-    if re.match(r"^\d{1,2}\s+\d{1,2}\s+\*\s+\*\s+1-5$", cron_expr):
+    if _WEEKDAYS_CRON_RE.match(cron_expr):
         return "Повтор по будням"
 
     # Ежемесячно (H M D * *)
-    if re.match(r"^\d{1,2}\s+\d{1,2}\s+\d{1,2}\s+\*\s+\*$", cron_expr):
+    if _MONTHLY_CRON_RE.match(cron_expr):
         return "Повтор ежемесячно"
 
     return "Повтор по расписанию"
@@ -125,6 +143,11 @@ def _apply_12h(hh: int, ampm: str) -> int:
     return hh
 
 
+def _normalize(s: str) -> str:
+    """Нижний регистр + схлопнутые пробелы за один проход (split() сам отбрасывает края)."""
+    return " ".join(s.lower().split())
+
+
 def _to_float(num_str: str) -> float:
     # «1,5» -> 1.5 ; «0,6» -> 0.6
     return float(num_str.replace(",", "."))
@@ -163,6 +186,43 @@ def _normalize_time_word_hour(h: int, part: str | None) -> int:
 # Парсинг одноразового времени (локально)
 # ---------------------------------------------
 
+# Шаблоны компилируем один раз при импорте, а не на каждое сообщение
+_PLUS_MIN_RE = re.compile(r"^\+\s*(\d{1,4})\s*$")
+_PLUS_HM_RE = re.compile(r"^\+\s*(?:(\d+(?:[.,]\d+)?)\s*(?:ч|часы|час|h))?(?:\s*(\d+(?:[.,]\d+)?)\s*(?:м|мин|минут[уы]?|m))?\s*$")
+_PLUS_MIN_UNIT_RE = re.compile(r"^\+\s*(\d{1,4})\s*(?:м|мин|минут[уы]?)\s*$")
+_THROUGH_FEW_RE = re.compile(r"^через\s+(пару|тройку)\s+(минут[уы]?|мин|часа?|часов)\s*$")
+_THROUGH_WORD_NUM_RE = re.compile(r"^через\s+([а-яё]+)\s+(минут[уы]?|мин|часа?|часов)\s*$")
+_THROUGH_MIXED_RE = re.compile(
+    r"^через\s+(?:(\d+(?:[.,]\d+)?)\s*(?:минут[уы]?|мин|м))?"
+    r"(?:\s*(\d+(?:[.,]\d+)?)\s*(?:час(?:а|ов)?|ч))?"
+    r"(?:\s*(\d+(?:[.,]\d+)?)\s*(?:д(?:ень|ня|ней)?|сут(?:ки|ок)?))?"
+    r"(?:\s*(\d+(?:[.,]\d+)?)\s*(?:недел(?:ю|и|ь)?))?"
+    r"(?:\s*(\d+(?:[.,]\d+)?)\s*(?:мес(?:яц)?(?:ев)?))?\s*$"
+)
+_THROUGH_H_M_RE = re.compile(
+    r"^через\s*(\d+(?:[.,]\d+)?)\s*(?:ч|час(?:а|ов)?)"
+    r"(?:\s*(?:и|,)?\s*(\d+(?:[.,]\d+)?)\s*(?:м|мин(?:ут[уы]?)?))?\s*\.?$"
+)
+_AFTER_RE = re.compile(r"^спустя\s+(\d+)\s*(д(ень|ня|ней)|сут(ки|ок)|час(а|ов)?|мин(ут[уы]?|))$")
+_THROUGH_WORD_RE = re.compile(r"^через\s+(день|два дня|сутки|неделю(?:\sровно)?|месяц)$")
+# «сегодня HH:MM», «в HH:MM» и просто «HH:MM» разбираются одинаково — один шаблон
+_DAY_HHMM_RE = re.compile(r"^(?:(?:сегодня|в)\s+)?(\d{1,2}):(\d{2})$")
+_TOMORROW_HHMM_RE = re.compile(r"^завтра\s+(\d{1,2}):(\d{2})$")
+_TOMORROW_12H_RE = re.compile(r"^завтра\s+(\d{1,2})(?::(\d{2}))?\s*(am|pm)$")
+_TIME_12H_RE = re.compile(r"^(\d{1,2})(?::(\d{2}))?\s*(am|pm)$")
+_AT_HOUR_RE = re.compile(r"^(?:около|примерно)?\s*в\s*(\d{1,2})(?:\s*(утра|вечера|ночи|дня))?$")
+_HHMM_RE = re.compile(r"^(\d{1,2}):(\d{2})$")
+
+
+def _today_or_tomorrow(now_local: datetime, hh: int, mm: int) -> tuple[datetime, str]:
+    """Ближайшее HH:MM: сегодня, а если уже прошло — завтра."""
+    candidate = now_local.replace(hour=hh, minute=mm, second=0, microsecond=0)
+    if candidate <= now_local:
+        candidate += timedelta(days=1)
+        return candidate, candidate.strftime("завтра в %H:%M")
+    return candidate, candidate.strftime("сегодня в %H:%M")
+
+
 def parse_once_when(s: str, now_local: datetime, tz: ZoneInfo):
     """
     Возвращает (when_local: datetime, human: str).
@@ -177,21 +237,34 @@ def parse_once_when(s: str, now_local: datetime, tz: ZoneInfo):
       «7:10 pm», «19:10»
       «в 9 утра/в 7 вечера/в полночь/в полдень», «около 7 вечера», «примерно в 6»
     """
-    src = " ".join(s.strip().lower().split())
+    # Быстрый путь: «HH:MM» и «+N» — самые частые ответы, букв в них нет,
+    # поэтому нормализация и перебор остальных веток не нужны.
+    # По первому символу сразу видно, есть ли смысл пробовать шаблоны.
+    raw = s.strip()
+    head = raw[:1]
+    if head.isdigit():
+        m = _HHMM_RE.match(raw)
+        if m:
+            return _today_or_tomorrow(now_local, int(m.group(1)), int(m.group(2)))
+    elif head == "+":
+        m = _PLUS_MIN_RE.match(raw)
+        if m:
+            minutes = int(m.group(1))
+            when = now_local + timedelta(minutes=minutes)
+            return when, f"через {minutes} {pluralize_minute_acc(minutes)}"
+
+    src = _normalize(s)
 
     # --------- (+N / +... ч/мин) ----------
     # + 90 / +90
-    m = re.match(r"^\+\s*(\d{1,4})\s*$", src)
+    m = _PLUS_MIN_RE.match(src)
     if m:
         minutes = int(m.group(1))
         when = now_local + timedelta(minutes=minutes)
         return when, f"через {minutes} {pluralize_minute_acc(minutes)}"
 
     # + 1ч / +1 ч / + 1 ч 30 мин / +1ч 30м / +1h 20m
-    m = re.match(
-        r"^\+\s*(?:(\d+(?:[.,]\d+)?)\s*(?:ч|часы|час|h))?(?:\s*(\d+(?:[.,]\d+)?)\s*(?:м|мин|минут[уы]?|m))?\s*$",
-        src
-    )
+    m = _PLUS_HM_RE.match(src)
     if m and (m.group(1) or m.group(2)):
         ch = _to_float(m.group(1)) if m.group(1) else 0.0
         mn = _to_float(m.group(2)) if m.group(2) else 0.0
@@ -200,7 +273,7 @@ def parse_once_when(s: str, now_local: datetime, tz: ZoneInfo):
         return when, f"через {total_min} {pluralize_minute_acc(total_min)}"
 
     # просто +N минут, явное указание
-    m = re.match(r"^\+\s*(\d{1,4})\s*(?:м|мин|минут[уы]?)\s*$", src)
+    m = _PLUS_MIN_UNIT_RE.match(src)
     if m:
         minutes = int(m.group(1))
         when = now_local + timedelta(minutes=minutes)
@@ -218,7 +291,7 @@ def parse_once_when(s: str, now_local: datetime, tz: ZoneInfo):
         return when, "через 1 минуту"
 
     # через пару минут/часов; через тройку минут
-    m = re.match(r"^через\s+(пару|тройку)\s+(минут[уы]?|мин|часа?|часов)\s*$", src)
+    m = _THROUGH_FEW_RE.match(src)
     if m:
         word = m.group(1)
         unit = m.group(2)
@@ -232,7 +305,7 @@ def parse_once_when(s: str, now_local: datetime, tz: ZoneInfo):
             return when, f"через {mins} {pluralize_minute_acc(mins)}"
 
     # через X (слово-число) минут/часов (напр. «через две минуты»)
-    m = re.match(r"^через\s+([а-яё]+)\s+(минут[уы]?|мин|часа?|часов)\s*$", src)
+    m = _THROUGH_WORD_NUM_RE.match(src)
     if m:
         num = _word_to_number(m.group(1))
         unit = m.group(2)
@@ -246,14 +319,7 @@ def parse_once_when(s: str, now_local: datetime, tz: ZoneInfo):
                 return when, f"через {mins} {pluralize_minute_acc(mins)}"
 
     # через 0,6 мин / 1,5 часа / 45 минут / 2 часа / 3 дня / 1 неделя / 1 месяц
-    m = re.match(
-        r"^через\s+(?:(\d+(?:[.,]\d+)?)\s*(?:минут[уы]?|мин|м))?"
-        r"(?:\s*(\d+(?:[.,]\d+)?)\s*(?:час(?:а|ов)?|ч))?"
-        r"(?:\s*(\d+(?:[.,]\d+)?)\s*(?:д(?:ень|ня|ней)?|сут(?:ки|ок)?))?"
-        r"(?:\s*(\d+(?:[.,]\d+)?)\s*(?:недел(?:ю|и|ь)?))?"
-        r"(?:\s*(\d+(?:[.,]\d+)?)\s*(?:мес(?:яц)?(?:ев)?))?\s*$",
-        src
-    )
+    m = _THROUGH_MIXED_RE.match(src)
     if m and any(m.groups()):
         mn = _to_float(m.group(1)) if m.group(1) else 0.0
         ch = _to_float(m.group(2)) if m.group(2) else 0.0
@@ -265,11 +331,7 @@ def parse_once_when(s: str, now_local: datetime, tz: ZoneInfo):
         return when, f"через {total_min} {pluralize_minute_acc(total_min)}"
 
     # через 1 ч 30 мин / через 1 час и 30 минут / через 1ч 30мин.
-    m = re.match(
-        r"^через\s*(\d+(?:[.,]\d+)?)\s*(?:ч|час(?:а|ов)?)"
-        r"(?:\s*(?:и|,)?\s*(\d+(?:[.,]\d+)?)\s*(?:м|мин(?:ут[уы]?)?))?\s*\.?$",
-        src
-    )
+    m = _THROUGH_H_M_RE.match(src)
     if m:
         ch = _to_float(m.group(1))
         mn = _to_float(m.group(2)) if m.group(2) else 0.0
@@ -278,7 +340,7 @@ def parse_once_when(s: str, now_local: datetime, tz: ZoneInfo):
         return when, f"через {total_min} {pluralize_minute_acc(total_min)}"
 
     # спустя N единиц (синоним «через»)
-    m = re.match(r"^спустя\s+(\d+)\s*(д(ень|ня|ней)|сут(ки|ок)|час(а|ов)?|мин(ут[уы]?|))$", src)
+    m = _AFTER_RE.match(src)
     if m:
         n = int(m.group(1))
         unit = m.group(2)
@@ -294,7 +356,7 @@ def parse_once_when(s: str, now_local: datetime, tz: ZoneInfo):
         return when, f"через {n} {pluralize_minute_acc(n)}"
 
     # через день/два дня/неделю/месяц/сутки/неделю ровно
-    m = re.match(r"^через\s+(день|два дня|сутки|неделю(?:\sровно)?|месяц)$", src)
+    m = _THROUGH_WORD_RE.match(src)
     if m:
         word = m.group(1)
         if word in ("день", "сутки"):
@@ -310,25 +372,20 @@ def parse_once_when(s: str, now_local: datetime, tz: ZoneInfo):
             when = now_local + timedelta(days=30)
             return when, "через 43200 минут"
 
-    # сегодня HH:MM
-    m = re.match(r"^сегодня\s+(\d{1,2}):(\d{2})$", src)
+    # сегодня HH:MM / в HH:MM / HH:MM
+    m = _DAY_HHMM_RE.match(src)
     if m:
-        hh, mm = int(m.group(1)), int(m.group(2))
-        candidate = now_local.replace(hour=hh, minute=mm, second=0, microsecond=0)
-        if candidate <= now_local:
-            candidate += timedelta(days=1)
-            return candidate, candidate.strftime("завтра в %H:%M")
-        return candidate, candidate.strftime("сегодня в %H:%M")
+        return _today_or_tomorrow(now_local, int(m.group(1)), int(m.group(2)))
 
     # завтра HH:MM
-    m = re.match(r"^завтра\s+(\d{1,2}):(\d{2})$", src)
+    m = _TOMORROW_HHMM_RE.match(src)
     if m:
         hh, mm = int(m.group(1)), int(m.group(2))
         base = (now_local + timedelta(days=1)).replace(hour=hh, minute=mm, second=0, microsecond=0)
         return base, base.strftime("завтра в %H:%M")
 
     # завтра 12h: "завтра 7:10 pm" / "завтра 7 pm"
-    m = re.match(r"^завтра\s+(\d{1,2})(?::(\d{2}))?\s*(am|pm)$", src)
+    m = _TOMORROW_12H_RE.match(src)
     if m:
         hh = int(m.group(1))
         mm = int(m.group(2) or 0)
@@ -338,7 +395,7 @@ def parse_once_when(s: str, now_local: datetime, tz: ZoneInfo):
         return base, base.strftime("завтра в %H:%M")
 
     # просто 12h: "7:10 pm", "7 pm"
-    m = re.match(r"^(\d{1,2})(?::(\d{2}))?\s*(am|pm)$", src)
+    m = _TIME_12H_RE.match(src)
     if m:
         hh = int(m.group(1))
         mm = int(m.group(2) or 0)
@@ -350,19 +407,8 @@ def parse_once_when(s: str, now_local: datetime, tz: ZoneInfo):
             return candidate, candidate.strftime("завтра в %H:%M")
         return candidate, candidate.strftime("сегодня в %H:%M")
 
-    # «в HH:MM», «в 9 утра/вечера/ночи/дня», «около 7 вечера», «примерно в 6»
-    # HH:MM
-    m = re.match(r"^в\s+(\d{1,2}):(\d{2})$", src)
-    if m:
-        hh, mm = int(m.group(1)), int(m.group(2))
-        candidate = now_local.replace(hour=hh, minute=mm, second=0, microsecond=0)
-        if candidate <= now_local:
-            candidate += timedelta(days=1)
-            return candidate, candidate.strftime("завтра в %H:%M")
-        return candidate, candidate.strftime("сегодня в %H:%M")
-
     # «в 9 утра/вечера/…» или «около 7 вечера», «примерно в 6»
-    m = re.match(r"^(?:около|примерно)?\s*в\s*(\d{1,2})(?:\s*(утра|вечера|ночи|дня))?$", src)
+    m = _AT_HOUR_RE.match(src)
     if m:
         hh = int(m.group(1))
         part = m.group(2)
@@ -385,16 +431,6 @@ def parse_once_when(s: str, now_local: datetime, tz: ZoneInfo):
             candidate += timedelta(days=1)
         return candidate, candidate.strftime("сегодня в %H:%M") if candidate.date() == now_local.date() else candidate.strftime("завтра в %H:%M")
 
-    # просто 24h: "HH:MM"
-    m = re.match(r"^(\d{1,2}):(\d{2})$", src)
-    if m:
-        hh, mm = int(m.group(1)), int(m.group(2))
-        candidate = now_local.replace(hour=hh, minute=mm, second=0, microsecond=0)
-        if candidate <= now_local:
-            candidate += timedelta(days=1)
-            return candidate, candidate.strftime("завтра в %H:%M")
-        return candidate, candidate.strftime("сегодня в %H:%M")
-
     raise ValueError("Не удалось распознать время. Примеры: +15, через 30 минут, через 1 ч 30 мин, завтра 09:00, 7:10 pm, в 9 утра, 12:00")
 
 
@@ -402,6 +438,16 @@ def parse_once_when(s: str, now_local: datetime, tz: ZoneInfo):
 # Парсинг расписаний (повторяющиеся)
 # ---------------------------------------------
 
+# HH:MM и 12h-шаблоны общие с parse_once_when (_HHMM_RE, _TIME_12H_RE)
+_EVERY_N_MIN_RE = re.compile(r"^кажд(ую|ые)\s+(\d{1,3}|[а-яё]+)\s+мин(уту|уты|ут|)$")
+_EVERY_N_HOURS_RE = re.compile(r"^кажд(ый|ые)\s+(\d{1,2}|[а-яё]+)?\s*час(а|ов)?$")
+_WEEKDAYS_RE = re.compile(r"^по\s+будням\s+(\d{1,2}):(\d{2})$")
+_DAILY_HHMM_RE = re.compile(r"^ежедневно\s+(\d{1,2}):(\d{2})$")
+_DAILY_12H_RE = re.compile(r"^ежедневно\s+(\d{1,2})(?::(\d{2}))?\s*(am|pm)$")
+_MONTHLY_RE = re.compile(r"^ежемесячно\s+(\d{1,2})\s+числа(?:\s+в\s+(\d{1,2}):(\d{2}))?$")
+_DAY_OF_MONTH_RE = re.compile(r"^(\d{1,2})\s+числа\s+каждого\s+месяца(?:\s+(\d{1,2}):(\d{2}))?$")
+
+
 def parse_repeat_spec(s: str, now_local: datetime):
     """
     Возвращает (cron_expr: str, human_suffix: str, next_local: datetime).
@@ -414,34 +460,38 @@ def parse_repeat_spec(s: str, now_local: datetime):
         «25 числа каждого месяца 18:30»
       - «cron: */15 * * * *»
     """
-    src = " ".join(s.strip().lower().split())
+    expr, human = _repeat_spec_to_cron(_normalize(s))
+    return expr, human, cron_next(expr, now_local)
+
 
+@lru_cache(maxsize=1024)
+def _repeat_spec_to_cron(src: str) -> tuple[str, str]:
+    """
+    Чистая часть parse_repeat_spec: нормализованный текст → (cron_expr, human_suffix).
+    От текущего времени не зависит, поэтому кэшируется (одни и те же «ежедневно 09:00» и т.п.).
+    """
     # cron: RAW
     if src.startswith("cron:"):
-        expr = src.split("cron:", 1)[1].strip()
-        _ = croniter(expr, now_local)
-        next_local = croniter(expr, now_local).get_next(datetime)
-        return expr, "по cron", next_local
+        # валидность проверит cron_next при расчёте next_local
+        return src.split("cron:", 1)[1].strip(), "по cron"
 
     # каждую минуту
     if src in ("каждую минуту", "каждая минута"):
         expr = "*/1 * * * *"
-        next_local = croniter(expr, now_local).get_next(datetime)
-        return expr, "через 1 минуту", next_local
+        return expr, "через 1 минуту"
 
     # каждые N минут / каждые две/три/пять минут(ы)
-    m = re.match(r"^кажд(ую|ые)\s+(\d{1,3}|[а-яё]+)\s+мин(уту|уты|ут|)$", src)
+    m = _EVERY_N_MIN_RE.match(src)
     if m:
         raw = m.group(2)
         n = int(raw) if raw.isdigit() else int(_word_to_number(raw) or 0)
         if n <= 0:
             raise ValueError("Некорректный интервал минут.")
         expr = f"*/{n} * * * *"
-        next_local = croniter(expr, now_local).get_next(datetime)
-        return expr, f"через {n} {pluralize_minute_acc(n)}", next_local
+        return expr, f"через {n} {pluralize_minute_acc(n)}"
 
     # каждый час / каждые N часов
-    m = re.match(r"^кажд(ый|ые)\s+(\d{1,2}|[а-яё]+)?\s*час(а|ов)?$", src)
+    m = _EVERY_N_HOURS_RE.match(src)
     if m:
         raw = m.group(2)
         n = 1 if not raw else (int(raw) if raw.isdigit() else int(_word_to_number(raw) or 0))
@@ -449,83 +499,74 @@ def parse_repeat_spec(s: str, now_local: datetime):
             n = 1
         # «каждый час» = «0 */1 * * *»
         expr = f"0 */{n} * * *"
-        next_local = croniter(expr, now_local).get_next(datetime)
         # Для суффикса дадим «через N минут» для ближайшего интервала — но это часы,
         # поэтому пишем человекочитаемо:
-        return expr, ("каждый час" if n == 1 else f"каждые {n} часа"), next_local
+        return expr, ("каждый час" if n == 1 else f"каждые {n} часа")
 
     # по будням HH:MM
-    m = re.match(r"^по\s+будням\s+(\d{1,2}):(\d{2})$", src)
+    m = _WEEKDAYS_RE.match(src)
     if m:
         hh, mm = int(m.group(1)), int(m.group(2))
         expr = f"{mm} {hh} * * 1-5"
-        next_local = croniter(expr, now_local).get_next(datetime)
-        return expr, "по будням", next_local
+        return expr, "по будням"
 
     # ежедневно HH:MM (24h)
-    m = re.match(r"^ежедневно\s+(\d{1,2}):(\d{2})$", src)
+    m = _DAILY_HHMM_RE.match(src)
     if m:
         hh, mm = int(m.group(1)), int(m.group(2))
         expr = f"{mm} {hh} * * *"
-        next_local = croniter(expr, now_local).get_next(datetime)
-        return expr, "ежедневно", next_local
+        return expr, "ежедневно"
 
     # ежедневно 12h
-    m = re.match(r"^ежедневно\s+(\d{1,2})(?::(\d{2}))?\s*(am|pm)$", src)
+    m = _DAILY_12H_RE.match(src)
     if m:
         hh = int(m.group(1))
         mm = int(m.group(2) or 0)
         ampm = m.group(3)
         hh24 = _apply_12h(hh, ampm)
         expr = f"{mm} {hh24} * * *"
-        next_local = croniter(expr, now_local).get_next(datetime)
-        return expr, "ежедневно", next_local
+        return expr, "ежедневно"
 
     # просто время -> ежедневно (24h)
-    m = re.match(r"^(\d{1,2}):(\d{2})$", src)
+    m = _HHMM_RE.match(src)
     if m:
         hh, mm = int(m.group(1)), int(m.group(2))
         expr = f"{mm} {hh} * * *"
-        next_local = croniter(expr, now_local).get_next(datetime)
-        return expr, "ежедневно", next_local
+        return expr, "ежедневно"
 
     # просто время -> ежедневно (12h)
-    m = re.match(r"^(\d{1,2})(?::(\d{2}))?\s*(am|pm)$", src)
+    m = _TIME_12H_RE.match(src)
     if m:
         hh = int(m.group(1))
         mm = int(m.group(2) or 0)
         ampm = m.group(3)
         hh24 = _apply_12h(hh, ampm)
         expr = f"{mm} {hh24} * * *"
-        next_local = croniter(expr, now_local).get_next(datetime)
-        return expr, "ежедневно", next_local
+        return expr, "ежедневно"
 
     # каждое первое число (в 09:00 по умолчанию)
     if src == "каждое первое число":
         hh, mm = 9, 0
         expr = f"{mm} {hh} 1 * *"
-        next_local = croniter(expr, now_local).get_next(datetime)
-        return expr, "ежемесячно", next_local
+        return expr, "ежемесячно"
 
     # ежемесячно 10 числа (в 09:00) / ежемесячно 10 числа в 08:00
-    m = re.match(r"^ежемесячно\s+(\d{1,2})\s+числа(?:\s+в\s+(\d{1,2}):(\d{2}))?$", src)
+    m = _MONTHLY_RE.match(src)
     if m:
         day = int(m.group(1))
         hh = int(m.group(2)) if m.group(2) else 9
         mm = int(m.group(3)) if m.group(3) else 0
         expr = f"{mm} {hh} {day} * *"
-        next_local = croniter(expr, now_local).get_next(datetime)
-        return expr, "ежемесячно", next_local
+        return expr, "ежемесячно"
 
     # 25 числа каждого месяца 18:30 / 25 числа каждого месяца
-    m = re.match(r"^(\d{1,2})\s+числа\s+каждого\s+месяца(?:\s+(\d{1,2}):(\d{2}))?$", src)
+    m = _DAY_OF_MONTH_RE.match(src)
     if m:
         day = int(m.group(1))
         hh = int(m.group(2)) if m.group(2) else 9
         mm = int(m.group(3)) if m.group(3) else 0
         expr = f"{mm} {hh} {day} * *"
-        next_local = croniter(expr, now_local).get_next(datetime)
-        return expr, "ежемесячно", next_local
+        return expr, "ежемесячно"
 
     raise ValueError("Не удалось распознать расписание. Примеры: "
                      "каждую минуту, каждые 2 минуты, каждые три минуты, каждый час, каждые 3 часа, "
@@ -533,12 +574,85 @@ def parse_repeat_spec(s: str, now_local: datetime):
                      "каждое первое число, ежемесячно 10 числа в 08:00, cron: */15 * * * *")
 
 
+# ---------------------------------------------
+# Следующее срабатывание cron
+# ---------------------------------------------
+
+@lru_cache(maxsize=1024)
+def _cron_iter(expr: str) -> croniter:
+    # Разбор выражения — самая дорогая часть croniter; на одно выражение держим один объект.
+    # Невалидное выражение бросает исключение и в кэш не попадает.
+    return croniter(expr)
+
+
+@lru_cache(maxsize=1024)
+def _cron_simple_form(expr: str) -> tuple[str, int, int] | None:
+    """
+    («every», N, 0) для «*/N * * * *», («daily», HH, MM) для «MM HH * * *», иначе None.
+    Это почти все выражения, которые генерирует бот; их считаем без croniter.
+    """
+    if expr == "* * * * *":
+        return "every", 1, 0
+    m = _EVERY_N_MIN_CRON_RE.match(expr)
+    if m:
+        n = int(m.group(1))
+        return ("every", n, 0) if 1 <= n <= 59 else None
+    m = _DAILY_CRON_RE.match(expr)
+    if m:
+        mm, hh = int(m.group(1)), int(m.group(2))
+        return ("daily", hh, mm) if hh <= 23 and mm <= 59 else None
+    return None
+
+
+def _cron_next_simple(form: tuple[str, int, int], base: datetime) -> datetime:
+    kind, a, b = form
+    start = base.replace(second=0, microsecond=0)
+    if kind == "every":
+        minute = (start.minute // a + 1) * a
+        if minute < 60:
+            return start.replace(minute=minute)
+        return start.replace(minute=0) + timedelta(hours=1)
+    candidate = start.replace(hour=a, minute=b)
+    if candidate <= base:
+        candidate += timedelta(days=1)
+    return candidate
+
+
+def _wall_time_is_plain(dt: datetime) -> bool:
+    """
+    True, если «стенное» время однозначно: не попадает в весенний разрыв (02:30 в ночь
+    перевода не существует — zoneinfo даёт ему старое смещение, utcoffset это не ловит)
+    и не в повторяющийся осенний час. Такие моменты считает croniter.
+    """
+    if dt.tzinfo is None:
+        return True
+    back = dt.astimezone(UTC_TZ).astimezone(dt.tzinfo)
+    if back.replace(tzinfo=None) != dt.replace(tzinfo=None):
+        return False
+    return dt.replace(fold=1).utcoffset() == dt.utcoffset()
+
+
+def cron_next(expr: str, base: datetime) -> datetime:
+    """Ближайшее срабатывание expr строго после base (в зоне base)."""
+    form = _cron_simple_form(expr)
+    # Арифметика по «стенным» часам верна, пока в ближайшие сутки нет перевода часов;
+    # иначе (DST) отдаём расчёт croniter
+    if form is not None and base.utcoffset() == (base + timedelta(days=1)).utcoffset():
+        candidate = _cron_next_simple(form, base)
+        if _wall_time_is_plain(candidate):
+            return candidate
+    it = _cron_iter(expr)
+    # set_current + get_next без await между ними — в одном event loop это безопасно
+    it.set_current(base, force=True)
+    return it.get_next(datetime)
+
+
 # ---------------------------------------------
 # Конвертации (совместимость со старым кодом)
 # ---------------------------------------------
 
 def to_utc(dt_local: datetime, tz: ZoneInfo):
-    return dt_local.astimezone(ZoneInfo("UTC"))
+    return dt_local.astimezone(UTC_TZ)
 
 
 def to_local(dt_utc: datetime, tz: ZoneInfo):
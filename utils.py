@@ -1,11 +1,34 @@
+import logging
+import time
+from functools import lru_cache
 from hashlib import blake2b
 
 def short_rid(uuid_str: str) -> str:
     h = blake2b(uuid_str.encode(), digest_size=3).hexdigest().upper()
     return f"RID-{h}"
 
-def is_owner(user_id: int, owner_id_env: str) -> bool:
+@lru_cache(maxsize=8)
+def _owner_id(owner_id_env: str) -> int | None:
+    # значение из env не меняется за время жизни процесса — разбираем один раз
     try:
-        return int(owner_id_env) == user_id
-    except Exception:
-        return False
+        return int(owner_id_env)
+    except (TypeError, ValueError):
+        return None
+
+def is_owner(user_id: int, owner_id_env: str) -> bool:
+    return _owner_id(owner_id_env) == user_id
+
+# Полный traceback по одному ключу — не чаще раза в минуту, иначе одна строка.
+# При падении БД цикл доставки и хендлеры иначе форматируют стек на каждой итерации.
+_TRACE_EVERY_SEC = 60.0
+_LAST_TRACE_AT: dict[str, float] = {}
+
+def log_exception_throttled(logger: logging.Logger, key: str, exc: BaseException) -> None:
+    """Вызывать из блока except."""
+    now = time.monotonic()
+    last = _LAST_TRACE_AT.get(key)
+    if last is None or now - last >= _TRACE_EVERY_SEC:
+        _LAST_TRACE_AT[key] = now
+        logger.exception("%s: %s", key, exc)
+    else:
+        logger.error("%s: %s", key, exc)